@@ -1,99 +1,341 @@
 # --- Imports ---
 import streamlit as st
 import sqlite3
+import csv
 import os
+import threading
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from reportlab.pdfgen import canvas
-import tempfile
-import base64
 import io
 
-# --- Streamlit Config ---
-st.set_page_config(page_title="Ky'ra Internship Dashboard", layout="wide", initial_sidebar_state="expanded")
-sns.set_style("whitegrid")
-
 # --- Database Connection ---
 @st.cache_resource
 def get_connection():
     db_path = os.path.join(os.getcwd(), "internship_tracking.db")
     if "STREAMLIT_CLOUD" in os.environ:
         db_path = os.path.join("/tmp", "internship_tracking.db")
-    conn = sqlite3.connect(db_path, check_same_thread=False)
-    return conn
+    # One long-lived autocommit connection per process shared by every session. All queries
+    # hold the lock so no reader sees (or is aborted by) another session's open transaction.
+    conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn, threading.Lock()
+
+# Bump when the DDL below changes so existing databases pick it up.
+SCHEMA_VERSION = 2
 
-@st.cache_data
+@st.cache_resource
 def initialize_database():
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS students (
-            student_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL
-        )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS internships (
-            internship_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id INTEGER,
-            company_name TEXT NOT NULL,
-            duration TEXT NOT NULL,
-            feedback TEXT,
-            msme_digitalized INTEGER DEFAULT 0,
-            FOREIGN KEY (student_id) REFERENCES students (student_id)
+    conn, lock = get_connection()
+    with lock:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        conn.execute("BEGIN")
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS students (
+                    student_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    email TEXT UNIQUE NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS internships (
+                    internship_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    student_id INTEGER,
+                    company_name TEXT NOT NULL,
+                    duration TEXT NOT NULL,
+                    feedback TEXT,
+                    msme_digitalized INTEGER NOT NULL DEFAULT 0,
+                    FOREIGN KEY (student_id) REFERENCES students (student_id)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feedback (
+                    feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    student_id INTEGER,
+                    rating INTEGER,
+                    comments TEXT,
+                    FOREIGN KEY (student_id) REFERENCES students (student_id)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_internships_student ON internships (student_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_student ON feedback (student_id)")
+            # Per-student running totals kept by a trigger so metrics don't rescan internships.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS student_summary (
+                    student_id INTEGER PRIMARY KEY,
+                    n_internships INTEGER NOT NULL DEFAULT 0,
+                    total_msmes INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_internships_summary AFTER INSERT ON internships
+                BEGIN
+                    INSERT INTO student_summary (student_id, n_internships, total_msmes)
+                    VALUES (NEW.student_id, 1, NEW.msme_digitalized)
+                    ON CONFLICT (student_id) DO UPDATE SET
+                        n_internships = n_internships + 1,
+                        total_msmes = total_msmes + NEW.msme_digitalized;
+                END
+            """)
+            # Backfill totals for databases created before the summary table existed.
+            conn.execute("""
+                INSERT OR REPLACE INTO student_summary (student_id, n_internships, total_msmes)
+                SELECT student_id, COUNT(*), COALESCE(SUM(msme_digitalized), 0)
+                FROM internships
+                GROUP BY student_id
+            """)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+
+# --- Database Helpers ---
+# Hot lookups share one SQL string each so sqlite3's statement cache reuses the prepared statement.
+SQL_STUDENT_BY_EMAIL = "SELECT student_id, name FROM students WHERE email = ?"
+SQL_STUDENT_WITH_INTERNSHIPS = """
+    SELECT s.student_id, s.name, i.company_name, i.duration, i.feedback, i.msme_digitalized
+    FROM students s
+    LEFT JOIN internships i ON s.student_id = i.student_id
+    WHERE s.email = ?
+"""
+
+def current_db_version():
+    # Every write goes through the one cached connection, so its change counter is a
+    # process-wide version; cached reads take it as an argument and miss after any write.
+    conn, lock = get_connection()
+    # Read under the lock so an open batch's uncommitted changes never become a cache key.
+    with lock:
+        return conn.total_changes
+
+def run_batch(sql, rows):
+    # Autocommit connection: wrap executemany in one explicit transaction.
+    conn, lock = get_connection()
+    with lock:
+        conn.execute("BEGIN")
+        try:
+            # rowcount excludes rows written by triggers, unlike total_changes.
+            inserted = conn.executemany(sql, rows).rowcount
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    return inserted
+
+def register_student(name, email):
+    conn, lock = get_connection()
+    try:
+        with lock:
+            conn.execute("INSERT INTO students (name, email) VALUES (?, ?)", (name, email))
+    except sqlite3.IntegrityError:
+        st.error("A student with this email is already registered.")
+        return False
+    return True
+
+def log_internship(email, company, duration, feedback, msme_digitalized):
+    conn, lock = get_connection()
+    with lock:
+        row = conn.execute(SQL_STUDENT_BY_EMAIL, (email,)).fetchone()
+        if row is None:
+            st.error("No student found with this email. Please register first.")
+            return False
+        conn.execute(
+            "INSERT INTO internships (student_id, company_name, duration, feedback, msme_digitalized) VALUES (?, ?, ?, ?, ?)",
+            (row[0], company, duration, feedback, msme_digitalized),
         )
-    """)
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS feedback (
-            feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id INTEGER,
-            rating INTEGER,
-            comments TEXT,
-            FOREIGN KEY (student_id) REFERENCES students (student_id)
+    return True
+
+def register_students_bulk(rows):
+    return run_batch("INSERT OR IGNORE INTO students (name, email) VALUES (?, ?)", rows)
+
+def log_internships_bulk(rows):
+    # Rows are (email, company, duration, feedback, msme_digitalized); unknown emails are skipped.
+    return run_batch(
+        """
+        INSERT INTO internships (student_id, company_name, duration, feedback, msme_digitalized)
+        SELECT student_id, ?, ?, ?, ? FROM students WHERE email = ?
+        """,
+        [(company, duration, feedback, msmes, email) for email, company, duration, feedback, msmes in rows],
+    )
+
+STUDENT_CSV_FIELDS = ("name", "email")
+INTERNSHIP_CSV_FIELDS = ("email", "company", "duration", "feedback", "msmes")
+
+def parse_csv_lines(text, fields, required):
+    # Returns (valid rows, per-line error messages); a leading header line naming the fields is skipped.
+    rows, errors = [], []
+    for line_no, values in enumerate(csv.reader(io.StringIO(text)), start=1):
+        values = [value.strip() for value in values]
+        if not any(values):
+            continue
+        if not rows and not errors and tuple(value.lower() for value in values) == fields:
+            continue
+        if len(values) != len(fields):
+            errors.append(f"Line {line_no}: expected {len(fields)} comma-separated values, got {len(values)}.")
+            continue
+        missing = [field for field, value in zip(fields, values) if field in required and not value]
+        if missing:
+            errors.append(f"Line {line_no}: missing {', '.join(missing)}.")
+            continue
+        rows.append((line_no, values))
+    return rows, errors
+
+def parse_student_lines(text):
+    rows, errors = parse_csv_lines(text, STUDENT_CSV_FIELDS, required=STUDENT_CSV_FIELDS)
+    return [tuple(values) for _, values in rows], errors
+
+def parse_internship_lines(text):
+    rows, errors = parse_csv_lines(text, INTERNSHIP_CSV_FIELDS, required=("email", "company", "duration", "msmes"))
+    internships = []
+    for line_no, (email, company, duration, feedback, msmes) in rows:
+        try:
+            msmes = int(msmes)
+        except ValueError:
+            msmes = -1
+        if msmes < 0:
+            errors.append(f"Line {line_no}: msmes must be a whole number of 0 or more.")
+            continue
+        internships.append((email, company, duration, feedback, msmes))
+    return internships, errors
+
+def log_feedback(student_id, rating, comments):
+    conn, lock = get_connection()
+    with lock:
+        conn.execute(
+            "INSERT INTO feedback (student_id, rating, comments) VALUES (?, ?, ?)",
+            (student_id, rating, comments),
         )
-    """)
-    conn.commit()
-    cur.close()
+    return True
+
+@st.cache_data(ttl=5, show_spinner=False)
+def fetch_student_data(email, db_version):
+    conn, lock = get_connection()
+    with lock:
+        rows = conn.execute(SQL_STUDENT_WITH_INTERNSHIPS, (email,)).fetchall()
+    if not rows:
+        return None
+    # company_name is NOT NULL, so a NULL here is the LEFT JOIN row for a student with no internships.
+    internships = [row[2:] for row in rows if row[2] is not None]
+    return {"student_id": rows[0][0], "name": rows[0][1], "internships": internships}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_reports(db_version):
+    conn, lock = get_connection()
+    with lock:
+        return pd.read_sql_query("""
+            SELECT s.name AS Name, s.email AS Email, i.company_name AS Company,
+                   i.duration AS Duration, i.feedback AS Feedback, i.msme_digitalized AS MSMEs
+            FROM students s
+            JOIN internships i ON s.student_id = i.student_id
+        """, conn)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_metrics(db_version):
+    conn, lock = get_connection()
+    with lock:
+        total_internships, total_msmes, certifications_issued = conn.execute(
+            "SELECT COALESCE(SUM(n_internships), 0), COALESCE(SUM(total_msmes), 0), COUNT(*) FROM student_summary"
+        ).fetchone()
+    return {
+        "total_internships": total_internships,
+        "total_msmes": total_msmes,
+        "certifications_issued": certifications_issued,
+    }
+
+# --- Charts ---
+# Plotting and PDF libraries are imported lazily so pages that don't use them start faster.
+# matplotlib's bundled copy of seaborn's whitegrid style, so neither seaborn nor pyplot is imported.
+PLOT_STYLE = "seaborn-v0_8-whitegrid"
+
+@st.cache_resource
+def get_progress_figure():
+    # A Figure built without pyplot renders with Agg and is never registered with pyplot's
+    # figure manager, so it can be cleared and reused across reruns; the lock serializes sessions.
+    import matplotlib.style
+    from matplotlib.figure import Figure
+    with matplotlib.style.context(PLOT_STYLE):
+        fig = Figure(figsize=(6, 4))
+        ax = fig.subplots()
+    return fig, ax, threading.Lock()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def plot_internship_progress(companies, msme_arr):
+    import matplotlib.style
+    positions = np.arange(len(msme_arr))
+    fig, ax, lock = get_progress_figure()
+    # ax.clear() re-reads rcParams, so the style has to be active while redrawing too.
+    with lock, matplotlib.style.context(PLOT_STYLE):
+        ax.clear()
+        ax.bar(positions, msme_arr)
+        ax.set_xticks(positions)
+        ax.set_xticklabels(companies, rotation=30, ha="right")
+        ax.set_xlabel("Company")
+        ax.set_ylabel("MSMEs Digitalized")
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=80, bbox_inches="tight")
+    return buf.getvalue()
+
+# --- Reports ---
+# Share of the page width per report column: Name, Email, Company, Duration, Feedback, MSMEs.
+REPORT_COLUMN_FRACTIONS = (0.14, 0.20, 0.15, 0.10, 0.33, 0.08)
+
+@st.cache_data(ttl=30, max_entries=32, show_spinner=False)
+def generate_pdf_report(data):
+    from xml.sax.saxutils import escape
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import landscape, letter
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
+
+    buf = io.BytesIO()
+    styles = getSampleStyleSheet()
+    cell_style = ParagraphStyle("ReportCell", parent=styles["BodyText"], fontSize=9, leading=11)
+
+    def cell(value):
+        # Paragraph cells wrap inside their column; plain strings in a Table never do.
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return Paragraph(escape(value).replace("\n", "<br/>"), cell_style)
+        return value
+
+    doc = SimpleDocTemplate(buf, pagesize=landscape(letter))
+    rows = [list(data.columns)] + [[cell(value) for value in row] for row in data.values.tolist()]
+    table = Table(
+        rows,
+        colWidths=[doc.width * fraction for fraction in REPORT_COLUMN_FRACTIONS],
+        repeatRows=1,
+        splitInRow=1,
+    )
+    table.setStyle(TableStyle([
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]))
+    doc.build([Paragraph("Ky'ra Internship Report", styles["Title"]), table])
+    return buf.getvalue()
+
+# --- Badges ---
+# Order matches the condition array built on the "Your Progress" page.
+BADGES = (
+    "🎯 First Step: logged your first internship",
+    "🏅 Internship Pro: 3+ internships logged",
+    "🚀 MSME Champion: 5+ MSMEs digitalized",
+)
 
 # --- Main UI ---
-initialize_database()
-
-st.title("🌟 Ky'ra: Your Internship Journey Mentor")
-
-if "page" not in st.session_state:
-    st.session_state.page = "Welcome"
-
-if st.session_state.page == "Welcome":
-    st.header("Welcome to Ky'ra! 🎉")
-    st.write("""
-        Ky'ra is your personal mentor to guide you through your internship journey:
-        - **Register**: Create your profile.
-        - **Log Internships**: Track your experiences.
-        - **View Progress**: See your growth.
-        - **Give Feedback**: Help improve Ky'ra!
-    """)
-    if st.button("Get Started"):
-        st.session_state.page = "Main"
-
-if st.session_state.page == "Main":
-    st.sidebar.header("Your Journey")
-    menu = ["Your Progress", "Log Internship", "Opportunities", "Feedback", "Generate Report"]
-    choice = st.sidebar.selectbox("Navigate", menu)
-
-    email_input = st.sidebar.text_input("Enter your email to personalize")
-    student_data = None
-    if email_input:
-        with st.spinner("Fetching your profile..."):
-            student_data = fetch_student_data(email_input)
-        if student_data:
-            total_internships = len(student_data["internships"])
-            st.sidebar.success(
-                f"Hi {student_data['name']}! You have logged {total_internships} internship{'s' if total_internships > 1 else ''}! 🚀"
-            )
-
-    metrics = fetch_metrics()
+@st.fragment(run_every="30s")
+def metrics_panel():
+    # Refreshes on its own timer without rerunning the rest of the page.
+    metrics = fetch_metrics(current_db_version())
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Internships Completed", metrics.get("total_internships", 0))
@@ -102,60 +344,158 @@ if st.session_state.page == "Main":
     with col3:
         st.metric("Certifications Issued", metrics.get("certifications_issued", 0))
 
-    if choice == "Log Internship":
-        st.header("🛠️ Log Internship")
-        email = st.text_input("Student Email")
-        company = st.text_input("Company Name")
-        duration = st.text_input("Duration (e.g., 3 months)")
-        feedback = st.text_area("Feedback")
-        msme_digitalized = st.number_input("MSMEs Digitalized", min_value=0)
-        if st.button("Submit Internship"):
-            if email and company and duration:
-                with st.spinner("Saving your internship..."):
-                    success = log_internship(email, company, duration, feedback, msme_digitalized)
-                if success:
-                    st.success("Internship logged successfully!")
-                    st.balloons()
+# UI only runs under `streamlit run`, so the helpers above can be imported without rendering the dashboard.
+def main():
+    st.set_page_config(page_title="Ky'ra Internship Dashboard", layout="wide", initial_sidebar_state="expanded")
+    initialize_database()
+
+    st.title("🌟 Ky'ra: Your Internship Journey Mentor")
+
+    if "page" not in st.session_state:
+        st.session_state.page = "Welcome"
+
+    if st.session_state.page == "Welcome":
+        st.header("Welcome to Ky'ra! 🎉")
+        st.write("""
+            Ky'ra is your personal mentor to guide you through your internship journey:
+            - **Register**: Create your profile.
+            - **Log Internships**: Track your experiences.
+            - **View Progress**: See your growth.
+            - **Give Feedback**: Help improve Ky'ra!
+        """)
+        if st.button("Get Started"):
+            st.session_state.page = "Main"
+
+    if st.session_state.page == "Main":
+        st.sidebar.header("Your Journey")
+        menu = ["Your Progress", "Register", "Log Internship", "Opportunities", "Feedback", "Generate Report"]
+        choice = st.sidebar.selectbox("Navigate", menu)
+
+        email_input = st.sidebar.text_input("Enter your email to personalize")
+        student_data = None
+        if email_input:
+            with st.spinner("Fetching your profile..."):
+                student_data = fetch_student_data(email_input, current_db_version())
+            if student_data:
+                total_internships = len(student_data["internships"])
+                st.sidebar.success(
+                    f"Hi {student_data['name']}! You have logged {total_internships} internship{'s' if total_internships > 1 else ''}! 🚀"
+                )
+
+        metrics_panel()
+
+        if choice == "Your Progress":
+            st.header("📈 Your Progress")
+            if student_data and student_data["internships"]:
+                internships = student_data["internships"]
+                msme_arr = np.fromiter((row[3] for row in internships), dtype=np.int64, count=len(internships))
+                total = msme_arr.size
+                msmes = int(msme_arr.sum())
+                st.write(f"**Internships logged:** {total} | **MSMEs digitalized:** {msmes}")
+                st.progress(min(total / 3, 1.0))
+                earned = np.array([total >= 1, total >= 3, msmes >= 5])
+                for badge, has_badge in zip(BADGES, earned):
+                    if has_badge:
+                        st.success(badge)
+                st.image(plot_internship_progress(tuple(row[0] for row in internships), msme_arr))
+            elif student_data:
+                st.info("You haven't logged any internships yet.")
             else:
-                st.error("Please fill in all required fields.")
-
-    if choice == "Generate Report":
-        st.header("📄 Generate Report")
-        with st.spinner("Generating your internship report..."):
-            report_data = fetch_reports()
-        if report_data:
-            pdf_path = generate_pdf_report(report_data)
-            with open(pdf_path, "rb") as f:
-                pdf_bytes = f.read()
-            b64_pdf = base64.b64encode(pdf_bytes).decode()
-            href = f'<a href="data:application/octet-stream;base64,{b64_pdf}" download="internship_report.pdf">📥 Download Report</a>'
-            st.markdown(href, unsafe_allow_html=True)
-        else:
-            st.info("No report data available yet.")
-
-    if choice == "Opportunities":
-        st.header("🚀 Opportunities")
-        st.info("More internship opportunities coming soon!")
-
-    if choice == "Feedback":
-        st.header("🗣️ Share Your Feedback")
-        if student_data:
-            st.subheader("Rate Your Experience")
-            feedback_type = st.radio("Choose feedback method:", ["Star Rating", "Emoji Scale"])
-            if feedback_type == "Star Rating":
-                rating = st.slider("Rate your experience", 1, 5, 3)
-                comments = st.text_area("Comments")
-                if st.button("Submit Feedback"):
-                    with st.spinner("Submitting feedback..."):
-                        if log_feedback(student_data["student_id"], rating, comments):
-                            st.success("Thanks for your feedback! 🌟")
+                st.info("Enter your email in the sidebar to see your progress.")
+
+        if choice == "Register":
+            st.header("📝 Register")
+            name = st.text_input("Full Name")
+            email = st.text_input("Email")
+            if st.button("Register"):
+                if name and email:
+                    if register_student(name, email):
+                        st.success(f"Welcome aboard, {name}! 🎉")
+                else:
+                    st.error("Please fill in all required fields.")
+            with st.expander("Bulk register (CSV)"):
+                bulk_text = st.text_area("One student per line: name,email")
+                if st.button("Register Students"):
+                    rows, errors = parse_student_lines(bulk_text)
+                    for error in errors:
+                        st.error(error)
+                    if rows:
+                        with st.spinner("Registering students..."):
+                            added = register_students_bulk(rows)
+                        st.success(f"Registered {added} of {len(rows)} valid students (existing emails skipped).")
+                    elif not errors:
+                        st.warning("Enter at least one student to register.")
+
+        if choice == "Log Internship":
+            st.header("🛠️ Log Internship")
+            email = st.text_input("Student Email")
+            company = st.text_input("Company Name")
+            duration = st.text_input("Duration (e.g., 3 months)")
+            feedback = st.text_area("Feedback")
+            msme_digitalized = st.number_input("MSMEs Digitalized", min_value=0)
+            if st.button("Submit Internship"):
+                if email and company and duration:
+                    with st.spinner("Saving your internship..."):
+                        success = log_internship(email, company, duration, feedback, msme_digitalized)
+                    if success:
+                        st.success("Internship logged successfully!")
+                        st.balloons()
+                else:
+                    st.error("Please fill in all required fields.")
+            with st.expander("Bulk log internships (CSV)"):
+                bulk_text = st.text_area("One internship per line: email,company,duration,feedback,msmes")
+                if st.button("Submit Internships"):
+                    rows, errors = parse_internship_lines(bulk_text)
+                    for error in errors:
+                        st.error(error)
+                    if rows:
+                        with st.spinner("Saving internships..."):
+                            added = log_internships_bulk(rows)
+                        st.success(f"Logged {added} of {len(rows)} valid internships (unregistered emails skipped).")
+                    elif not errors:
+                        st.warning("Enter at least one internship to log.")
+
+        if choice == "Generate Report":
+            st.header("📄 Generate Report")
+            with st.spinner("Generating your internship report..."):
+                report_data = fetch_reports(current_db_version())
+            if not report_data.empty:
+                st.dataframe(report_data, hide_index=True)
+                pdf_bytes = generate_pdf_report(report_data)
+                st.download_button(
+                    "📥 Download Report",
+                    data=pdf_bytes,
+                    file_name="internship_report.pdf",
+                    mime="application/pdf",
+                )
             else:
-                emoji_ratings = {"😊": 5, "🙂": 3, "😔": 1}
-                emoji = st.selectbox("How do you feel?", list(emoji_ratings.keys()))
-                comments = st.text_area("Comments (optional)")
-                if st.button("Submit Emoji Feedback"):
-                    with st.spinner("Submitting emoji feedback..."):
-                        rating = emoji_ratings[emoji]
-                        if log_feedback(student_data["student_id"], rating, comments):
-                            st.success("Thanks for your emoji feedback! 🎉")
+                st.info("No report data available yet.")
+
+        if choice == "Opportunities":
+            st.header("🚀 Opportunities")
+            st.info("More internship opportunities coming soon!")
+
+        if choice == "Feedback":
+            st.header("🗣️ Share Your Feedback")
+            if student_data:
+                st.subheader("Rate Your Experience")
+                feedback_type = st.radio("Choose feedback method:", ["Star Rating", "Emoji Scale"])
+                if feedback_type == "Star Rating":
+                    rating = st.slider("Rate your experience", 1, 5, 3)
+                    comments = st.text_area("Comments")
+                    if st.button("Submit Feedback"):
+                        with st.spinner("Submitting feedback..."):
+                            if log_feedback(student_data["student_id"], rating, comments):
+                                st.success("Thanks for your feedback! 🌟")
+                else:
+                    emoji_ratings = {"😊": 5, "🙂": 3, "😔": 1}
+                    emoji = st.selectbox("How do you feel?", list(emoji_ratings.keys()))
+                    comments = st.text_area("Comments (optional)")
+                    if st.button("Submit Emoji Feedback"):
+                        with st.spinner("Submitting emoji feedback..."):
+                            rating = emoji_ratings[emoji]
+                            if log_feedback(student_data["student_id"], rating, comments):
+                                st.success("Thanks for your emoji feedback! 🎉")
 
+if __name__ == "__main__":
+    main()